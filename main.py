@@ -1,29 +1,37 @@
 # main.py
 import asyncio
+import signal
+import sys
+from dotenv import load_dotenv
 from signals.auth.telegram_auth import TelegramAuth
 from signals.parser.channel_parser import ChannelParser
+from signals.signal_queue import SignalQueue
 from trading.config import TradingConfig
 from trading.bybit_client import BybitClient
 from trading.position_manager import PositionManager
 from trading.signal_processor import process_signals_queue
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+SIGNAL_QUEUE_SIZE = 512
+
 
 class BotApplication:
     """Главное приложение бота"""
 
     def __init__(self):
-        self.logger = get_logger(__name__)
         self.telegram_auth = TelegramAuth()
-        self.signal_queue = asyncio.Queue()
+        self.signal_queue = SignalQueue(maxsize=SIGNAL_QUEUE_SIZE)
         self.channel_parser = None
         self.position_manager = None
         self.running = False
         self.shutdown_event = asyncio.Event()
+        self.tasks = []
 
     async def start(self):
         """Запуск бота"""
-        self.logger.info("Запуск торгового бота")
+        logger.info("Запуск торгового бота")
 
         try:
             client = await self.telegram_auth.connect()
@@ -35,44 +43,82 @@ class BotApplication:
             self.channel_parser = ChannelParser(client, self.signal_queue)
 
             self.running = True
-            self.logger.info("Бот активен и готов к работе")
+            logger.info("Бот активен и готов к работе")
+
+            await self.channel_parser.start()
 
-            await asyncio.gather(
-                self.channel_parser.start(),
-                process_signals_queue(self.signal_queue, self.position_manager),
-                self.shutdown_event.wait()
-            )
+            self._install_signal_handlers()
+
+            self.tasks = [
+                asyncio.create_task(process_signals_queue(self.signal_queue, self.position_manager)),
+                asyncio.create_task(self.shutdown_event.wait())
+            ]
+
+            done, _ = await asyncio.wait(self.tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
 
         except Exception as e:
-            self.logger.error(f"Критическая ошибка: {e}", exc_info=True)
+            logger.error("Критическая ошибка: %s", e, exc_info=True)
         finally:
+            await self._cancel_tasks()
             await self.stop()
 
+    def _install_signal_handlers(self):
+        """Остановка по SIGINT/SIGTERM через shutdown_event"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.shutdown_event.set)
+            except NotImplementedError:
+                # Windows: остается стандартный KeyboardInterrupt
+                pass
+
+    async def _cancel_tasks(self):
+        """Отмена фоновых задач и ожидание их завершения"""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
     async def stop(self):
         """Остановка бота"""
         if not self.running:
             return
 
         self.running = False
-        self.logger.info("Остановка бота...")
+        logger.info("Остановка бота...")
+        if self.channel_parser:
+            await self.channel_parser.stop()
         await self.telegram_auth.disconnect()
-        self.logger.info("Бот остановлен")
+        logger.info("Бот остановлен")
         self.shutdown_event.set()
 
 
 async def main():
     """Точка входа"""
+    load_dotenv()
     bot = BotApplication()
+    await bot.start()
+
+
+def install_event_loop_policy():
+    """Выбор реализации event loop: uvloop, если доступен"""
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return
 
     try:
-        await bot.start()
-    except KeyboardInterrupt:
-        bot.logger.info("Получен сигнал остановки")
-        if bot.running:
-            await bot.stop()
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
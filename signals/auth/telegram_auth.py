@@ -1,4 +1,5 @@
 # signals/auth/telegram_auth.py
+import asyncio
 from pathlib import Path
 from typing import Optional
 from telethon import TelegramClient
@@ -6,23 +7,45 @@ from telethon.errors import SessionPasswordNeededError
 from signals.config import AuthConfig
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+_SESSIONS_DIR = Path(__file__).resolve().parent / 'sessions'
+_SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+
 
 class TelegramAuth:
     """Управление авторизацией в Telegram аккаунте"""
 
-    def __init__(self, config: Optional[AuthConfig] = None):
-        self.logger = get_logger(__name__)
+    __slots__ = ('config', 'session_path', 'client')
 
+    def __init__(self, config: Optional[AuthConfig] = None):
         self.config = config if config else AuthConfig.from_env()
 
-        project_root = Path(__file__).resolve().parent.parent.parent
-        self.sessions_dir = project_root / 'signals' / 'auth' / 'sessions'
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
-
-        self.session_path = self.sessions_dir / f"{self.config.session_name}.session"
+        self.session_path = _SESSIONS_DIR / f"{self.config.session_name}.session"
 
         self.client: Optional[TelegramClient] = None
 
+    def _build_client(self) -> TelegramClient:
+        """
+        Создание TelegramClient (один раз на экземпляр)
+
+        Returns:
+            TelegramClient, переиспользуемый при переподключениях
+        """
+        if self.client is None:
+            self.client = TelegramClient(
+                str(self.session_path),
+                self.config.api_id,
+                self.config.api_hash,
+                device_model="Trading Bot Server",
+                system_version="1.0",
+                app_version="1.0.0",
+                lang_code="en",
+                system_lang_code="en",
+                receive_updates=True
+            )
+        return self.client
+
     async def connect(self) -> TelegramClient:
         """
         Подключение к Telegram аккаунту
@@ -31,54 +54,43 @@ class TelegramAuth:
             Активный TelegramClient
         """
         if self.client and self.client.is_connected():
-            self.logger.info("Клиент уже подключен")
+            logger.info("Клиент уже подключен")
             return self.client
 
-        self.client = TelegramClient(
-            str(self.session_path),
-            self.config.api_id,
-            self.config.api_hash,
-            device_model="Trading Bot Server",
-            system_version="1.0",
-            app_version="1.0.0",
-            lang_code="en",
-            system_lang_code="en"
-        )
-
-        await self.client.connect()
+        await self._build_client().connect()
 
         if not await self.client.is_user_authorized():
-            self.logger.info("Требуется авторизация")
+            logger.info("Требуется авторизация")
             await self._authorize()
         else:
-            self.logger.info("Сессия активна, авторизация не требуется")
+            logger.info("Сессия активна, авторизация не требуется")
 
         me = await self.client.get_me()
-        self.logger.info(f"Подключен как: {me.first_name} (@{me.username if me.username else 'no username'})")
+        logger.info("Подключен как: %s (@%s)", me.first_name, me.username or 'no username')
 
         return self.client
 
     async def _authorize(self) -> None:
         """Процесс авторизации с обработкой кода и 2FA"""
         await self.client.send_code_request(self.config.phone)
-        self.logger.info(f"Код отправлен на {self.config.phone}")
+        logger.info("Код отправлен на %s", self.config.phone)
 
-        code = input("Введите код из Telegram: ").strip()
+        code = (await asyncio.to_thread(input, "Введите код из Telegram: ")).strip()
 
         try:
             await self.client.sign_in(self.config.phone, code)
-            self.logger.info("Авторизация успешна")
+            logger.info("Авторизация успешна")
         except SessionPasswordNeededError:
-            self.logger.info("Требуется 2FA пароль")
-            password = input("Введите 2FA пароль: ").strip()
+            logger.info("Требуется 2FA пароль")
+            password = (await asyncio.to_thread(input, "Введите 2FA пароль: ")).strip()
             await self.client.sign_in(password=password)
-            self.logger.info("Авторизация с 2FA успешна")
+            logger.info("Авторизация с 2FA успешна")
 
     async def disconnect(self) -> None:
         """Корректное отключение клиента"""
         if self.client and self.client.is_connected():
             await self.client.disconnect()
-            self.logger.info("Клиент отключен")
+            logger.info("Клиент отключен")
 
     async def is_authorized(self) -> bool:
         """
@@ -93,7 +105,7 @@ class TelegramAuth:
         try:
             return await self.client.is_user_authorized()
         except Exception as e:
-            self.logger.error(f"Ошибка проверки авторизации: {e}")
+            logger.error("Ошибка проверки авторизации: %s", e)
             return False
 
     def get_client(self) -> Optional[TelegramClient]:
@@ -1,11 +1,14 @@
 # signals/config.py
 import os
-from dataclasses import dataclass
-from typing import List
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
 
+_CHANNEL_PREFIX = 'CHANNEL_'
+_ENABLED_SUFFIX = '_ENABLED'
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AuthConfig:
     """Конфигурация для авторизации в Telegram"""
 
@@ -25,34 +28,10 @@ class AuthConfig:
         Raises:
             ValueError: Если обязательные параметры отсутствуют или некорректны
         """
-        load_dotenv()
-
-        api_id_str = os.getenv('API_ID')
-        api_hash = os.getenv('API_HASH')
-        phone = os.getenv('PHONE_NUMBER')
-        session_name = os.getenv('SESSION_NAME', 'trading_bot_session')
-
-        if not api_id_str:
-            raise ValueError("API_ID должен быть указан в .env")
-        if not api_hash:
-            raise ValueError("API_HASH должен быть указан в .env")
-        if not phone:
-            raise ValueError("PHONE_NUMBER должен быть указан в .env")
-
-        try:
-            api_id = int(api_id_str)
-        except ValueError:
-            raise ValueError("API_ID должен быть числом")
+        return _load_auth_config()
 
-        return cls(
-            api_id=api_id,
-            api_hash=api_hash,
-            phone=phone,
-            session_name=session_name
-        )
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Channel:
     """Конфигурация канала для парсинга"""
 
@@ -66,6 +45,12 @@ class ChannelsConfig:
     """Конфигурация всех каналов"""
 
     channels: List[Channel]
+    _active_channels: Tuple[Channel, ...] = field(init=False, repr=False)
+    _active_chat_ids: FrozenSet[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._active_channels = tuple(ch for ch in self.channels if ch.enabled)
+        self._active_chat_ids = frozenset(ch.chat_id for ch in self._active_channels)
 
     @classmethod
     def from_env(cls) -> "ChannelsConfig":
@@ -75,54 +60,76 @@ class ChannelsConfig:
         Returns:
             ChannelsConfig экземпляр
         """
-        load_dotenv()
-
-        channels = []
-
-        channel_prefixes = set()
-        for key in os.environ.keys():
-            if key.startswith('CHANNEL_') and not key.endswith('_ENABLED'):
-                prefix = key
-                channel_prefixes.add(prefix)
-
-        for prefix in channel_prefixes:
-            chat_id_str = os.getenv(prefix)
-            enabled_str = os.getenv(f"{prefix}_ENABLED", "false")
+        return _load_channels_config()
 
-            if not chat_id_str:
-                continue
-
-            try:
-                chat_id = int(chat_id_str)
-            except ValueError:
-                continue
-
-            enabled = enabled_str.lower() in ('true', '1', 'yes')
-
-            name = prefix.replace('CHANNEL_', '').lower()
-
-            channels.append(Channel(
-                name=name,
-                chat_id=chat_id,
-                enabled=enabled
-            ))
-
-        return cls(channels=channels)
-
-    def get_active_channels(self) -> List[Channel]:
+    def get_active_channels(self) -> Tuple[Channel, ...]:
         """
         Получение списка активных каналов
 
         Returns:
-            Список активных каналов
+            Кортеж активных каналов
         """
-        return [ch for ch in self.channels if ch.enabled]
+        return self._active_channels
 
-    def get_active_chat_ids(self) -> List[int]:
+    def get_active_chat_ids(self) -> FrozenSet[int]:
         """
-        Получение списка ID активных каналов
+        Получение ID активных каналов
 
         Returns:
-            Список chat_id активных каналов
+            Множество chat_id активных каналов
         """
-        return [ch.chat_id for ch in self.channels if ch.enabled]
\ No newline at end of file
+        return self._active_chat_ids
+
+
+@lru_cache(maxsize=1)
+def _load_auth_config() -> AuthConfig:
+    """Чтение AuthConfig из окружения (кешируется)"""
+    api_id_str = os.getenv('API_ID')
+    api_hash = os.getenv('API_HASH')
+    phone = os.getenv('PHONE_NUMBER')
+    session_name = os.getenv('SESSION_NAME', 'trading_bot_session')
+
+    if not api_id_str:
+        raise ValueError("API_ID должен быть указан в .env")
+    if not api_hash:
+        raise ValueError("API_HASH должен быть указан в .env")
+    if not phone:
+        raise ValueError("PHONE_NUMBER должен быть указан в .env")
+
+    try:
+        api_id = int(api_id_str)
+    except ValueError:
+        raise ValueError("API_ID должен быть числом")
+
+    return AuthConfig(
+        api_id=api_id,
+        api_hash=api_hash,
+        phone=phone,
+        session_name=session_name
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_channels_config() -> ChannelsConfig:
+    """Чтение ChannelsConfig из окружения (кешируется)"""
+    env = dict(os.environ)
+    channels = []
+
+    for key, chat_id_str in env.items():
+        if not key.startswith(_CHANNEL_PREFIX) or key.endswith(_ENABLED_SUFFIX) or not chat_id_str:
+            continue
+
+        try:
+            chat_id = int(chat_id_str)
+        except ValueError:
+            continue
+
+        enabled = env.get(f"{key}{_ENABLED_SUFFIX}", "false").lower() in ('true', '1', 'yes')
+
+        channels.append(Channel(
+            name=key[len(_CHANNEL_PREFIX):].lower(),
+            chat_id=chat_id,
+            enabled=enabled
+        ))
+
+    return ChannelsConfig(channels=channels)
\ No newline at end of file
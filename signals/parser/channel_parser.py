@@ -1,44 +1,74 @@
 # signals/parser/channel_parser.py
 import asyncio
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from telethon import TelegramClient, events
 from signals.config import ChannelsConfig
 from signals.parser.signal_validator import SignalValidator
 from signals.parser.signal_parser import SignalParser
+from signals.signal_queue import SignalQueue
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
+
 
 class ChannelParser:
     """Парсер сообщений из Telegram каналов"""
 
+    PROCESSED_IDS_LIMIT = 10_000
+    # Окно (сек), в котором сигнал с тем же (asset, direction, entry) считается повтором
+    SIGNAL_DEDUP_WINDOW = 5 * 60
+
+    __slots__ = (
+        'client', 'signal_queue', 'channels_config', 'active_channels', 'active_chat_ids',
+        '_chat_id_to_name', '_processed', '_processed_signals', '_handler_registered'
+    )
+
     def __init__(
             self,
             client: TelegramClient,
-            signal_queue: asyncio.Queue,
+            signal_queue: SignalQueue,
             channels_config: Optional[ChannelsConfig] = None
     ):
-        self.logger = get_logger(__name__)
         self.client = client
         self.signal_queue = signal_queue
         self.channels_config = channels_config if channels_config else ChannelsConfig.from_env()
         self.active_channels = self.channels_config.get_active_channels()
         self.active_chat_ids = self.channels_config.get_active_chat_ids()
+        self._chat_id_to_name = {ch.chat_id: ch.name for ch in self.active_channels}
+        self._processed: OrderedDict = OrderedDict()
+        self._processed_signals: OrderedDict = OrderedDict()
+        self._handler_registered = False
 
     async def start(self):
         """Запуск прослушивания каналов"""
         if not self.active_chat_ids:
-            self.logger.warning("Нет активных каналов для прослушивания")
+            logger.warning("Нет активных каналов для прослушивания")
             return
 
-        self.logger.info(f"Запуск парсера для {len(self.active_channels)} каналов:")
+        logger.info("Запуск парсера для %d каналов:", len(self.active_channels))
         for channel in self.active_channels:
-            self.logger.info(f"  - {channel.name} (ID: {channel.chat_id})")
+            logger.info("  - %s (ID: %s)", channel.name, channel.chat_id)
+
+        if not self._handler_registered:
+            # Telethon принимает только list/tuple/set, frozenset воспринимается как одиночный чат
+            self.client.add_event_handler(
+                self._handle_new_message,
+                events.NewMessage(chats=list(self.active_chat_ids))
+            )
+            self._handler_registered = True
 
-        @self.client.on(events.NewMessage(chats=self.active_chat_ids))
-        async def handler(event):
-            await self._handle_new_message(event)
+        logger.info("Парсер активен, ожидание новых сообщений...")
 
-        self.logger.info("Парсер активен, ожидание новых сообщений...")
+    async def stop(self):
+        """Остановка прослушивания каналов"""
+        if not self._handler_registered:
+            return
+
+        self.client.remove_event_handler(self._handle_new_message)
+        self._handler_registered = False
+        logger.info("Парсер остановлен")
 
     async def _handle_new_message(self, event):
         """
@@ -54,18 +84,86 @@ class ChannelParser:
             if not SignalValidator.is_signal(message_text):
                 return
 
+            message_id = event.message.id
+            if self._is_processed((chat_id, message_id)):
+                logger.debug("Сообщение %s из чата %s уже обработано, пропуск", message_id, chat_id)
+                return
+
             channel_name = self._get_channel_name(chat_id)
 
-            signal = SignalParser.parse(message_text)
+            signal = await asyncio.to_thread(SignalParser.parse, message_text)
 
             if signal:
-                await self.signal_queue.put(signal)
-                self.logger.info(f"[{channel_name}] Сигнал добавлен в очередь: {signal}")
+                # В кеше хранится 64-битный хеш вместо кортежа со ссылками на str/float
+                signal_key = hash((signal.asset, signal.direction, signal.entry))
+                if self._is_recent_signal(signal_key):
+                    logger.info("[%s] Повторный сигнал, пропуск: %s", channel_name, signal)
+                    return
+
+                try:
+                    self.signal_queue.put_nowait(signal)
+                except asyncio.QueueFull:
+                    logger.warning("[%s] Очередь сигналов переполнена, ожидание места", channel_name)
+                    await self.signal_queue.put(signal)
+                logger.info("[%s] Сигнал добавлен в очередь: %s", channel_name, signal)
             else:
-                self.logger.warning(f"[{channel_name}] Не удалось распарсить сигнал")
+                logger.warning("[%s] Не удалось распарсить сигнал", channel_name)
 
         except Exception as e:
-            self.logger.error(f"Ошибка обработки сообщения: {e}", exc_info=True)
+            logger.error("Ошибка обработки сообщения: %s", e, exc_info=True)
+
+    def _is_processed(self, key: Tuple[int, int]) -> bool:
+        """
+        Проверка и запоминание сообщения в LRU-кеше обработанных
+
+        Хранится не более PROCESSED_IDS_LIMIT последних ключей, самые старые вытесняются
+        Проверка и запись идут без await между ними, поэтому asyncio.Lock не нужен
+
+        Args:
+            key: (chat_id, message_id)
+
+        Returns:
+            True если сообщение уже обрабатывалось
+        """
+        if key in self._processed:
+            self._processed.move_to_end(key)
+            return True
+
+        self._processed[key] = None
+        if len(self._processed) > self.PROCESSED_IDS_LIMIT:
+            self._processed.popitem(last=False)
+        return False
+
+    def _is_recent_signal(self, key: int) -> bool:
+        """
+        Проверка повтора сигнала в пределах SIGNAL_DEDUP_WINDOW
+
+        Время первого появления не обновляется при повторе, поэтому кеш
+        упорядочен по времени и устаревшие ключи снимаются с начала.
+        Тот же сигнал после окна снова принимается в работу
+
+        Args:
+            key: Хеш (asset, direction, entry)
+
+        Returns:
+            True если такой сигнал уже был в пределах окна
+        """
+        now = time.monotonic()
+        processed = self._processed_signals
+
+        while processed:
+            oldest_key, seen_at = next(iter(processed.items()))
+            if now - seen_at < self.SIGNAL_DEDUP_WINDOW:
+                break
+            del processed[oldest_key]
+
+        if key in processed:
+            return True
+
+        processed[key] = now
+        if len(processed) > self.PROCESSED_IDS_LIMIT:
+            processed.popitem(last=False)
+        return False
 
     def _get_channel_name(self, chat_id: int) -> str:
         """
@@ -77,7 +175,4 @@ class ChannelParser:
         Returns:
             Имя канала или 'unknown'
         """
-        for channel in self.active_channels:
-            if channel.chat_id == chat_id:
-                return channel.name
-        return "unknown"
\ No newline at end of file
+        return self._chat_id_to_name.get(chat_id, "unknown")
\ No newline at end of file
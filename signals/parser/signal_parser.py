@@ -1,8 +1,21 @@
 # signals/parser/signal_parser.py
 import re
+import sys
 from typing import Optional
 from signals.models import Signal
 
+_ASSET_RE = re.compile(r'([A-Z]+/USDT)')
+_LEVERAGE_RE = re.compile(r'Leverage:.*?\((\d+)X\)', re.IGNORECASE)
+_ENTRY_RE = re.compile(r'Entry Targets:\s*(\d+\.?\d*)', re.IGNORECASE)
+# Секция TP всегда заканчивается на Stop Targets, поэтому TP и стоп
+# извлекаются одним проходом; остальные поля ищутся независимо от порядка
+_TP_STOP_RE = re.compile(
+    r'Take-Profit Targets:(?P<take_profits>.*?)'
+    r'Stop Targets:(?:\s*(?P<stop_loss>\d+\.?\d*))?',
+    re.IGNORECASE | re.DOTALL
+)
+_TP_ITEM_RE = re.compile(r'\d+\)\s*(\d+\.?\d*)')
+
 
 class SignalParser:
     """Парсер торговых сигналов"""
@@ -19,14 +32,21 @@ class SignalParser:
             Signal или None если парсинг не удался
         """
         try:
-            lines = text.strip().split('\n')
+            first_line = SignalParser._first_line(text)
+
+            asset = SignalParser._parse_asset(first_line)
+            direction = SignalParser._parse_direction(first_line)
+
+            leverage_match = _LEVERAGE_RE.search(text)
+            entry_match = _ENTRY_RE.search(text)
+            tp_stop_match = _TP_STOP_RE.search(text)
+            if not (leverage_match and entry_match and tp_stop_match and tp_stop_match.group('stop_loss')):
+                return None
 
-            asset = SignalParser._parse_asset(lines[0])
-            direction = SignalParser._parse_direction(lines[0])
-            leverage = SignalParser._parse_leverage(text)
-            entry = SignalParser._parse_entry(text)
-            take_profits = SignalParser._parse_take_profits(text)
-            stop_loss = SignalParser._parse_stop_loss(text)
+            leverage = int(leverage_match.group(1))
+            entry = float(entry_match.group(1))
+            take_profits = SignalParser._parse_take_profits(tp_stop_match.group('take_profits'))
+            stop_loss = float(tp_stop_match.group('stop_loss'))
 
             if not all([asset, direction, leverage, entry, take_profits, stop_loss]):
                 return None
@@ -43,11 +63,18 @@ class SignalParser:
         except (IndexError, ValueError, AttributeError):
             return None
 
+    @staticmethod
+    def _first_line(text: str) -> str:
+        """Первая непустая строка без разбиения всего текста на строки"""
+        text = text.lstrip()
+        end = text.find('\n')
+        return text if end == -1 else text[:end]
+
     @staticmethod
     def _parse_asset(first_line: str) -> Optional[str]:
         """Извлечение актива из первой строки"""
-        match = re.search(r'([A-Z]+/USDT)', first_line)
-        return match.group(1) if match else None
+        match = _ASSET_RE.search(first_line)
+        return sys.intern(match.group(1)) if match else None
 
     @staticmethod
     def _parse_direction(first_line: str) -> Optional[str]:
@@ -60,34 +87,11 @@ class SignalParser:
         return None
 
     @staticmethod
-    def _parse_leverage(text: str) -> Optional[int]:
-        """Извлечение кредитного плеча"""
-        match = re.search(r'Leverage:.*?\((\d+)X\)', text, re.IGNORECASE)
-        return int(match.group(1)) if match else None
-
-    @staticmethod
-    def _parse_entry(text: str) -> Optional[float]:
-        """Извлечение цены входа"""
-        match = re.search(r'Entry Targets:\s*(\d+\.?\d*)', text, re.IGNORECASE)
-        return float(match.group(1)) if match else None
-
-    @staticmethod
-    def _parse_take_profits(text: str) -> Optional[list]:
-        """Извлечение всех take-profit уровней"""
-        tp_section = re.search(r'Take-Profit Targets:(.*?)Stop Targets:', text, re.IGNORECASE | re.DOTALL)
-        if not tp_section:
-            return None
-
-        tp_text = tp_section.group(1)
-        matches = re.findall(r'\d+\)\s*(\d+\.?\d*)', tp_text)
+    def _parse_take_profits(tp_text: str) -> Optional[list]:
+        """Извлечение всех take-profit уровней из секции Take-Profit Targets"""
+        matches = _TP_ITEM_RE.findall(tp_text)
 
         if not matches:
             return None
 
-        return [float(tp) for tp in matches]
-
-    @staticmethod
-    def _parse_stop_loss(text: str) -> Optional[float]:
-        """Извлечение stop-loss уровня"""
-        match = re.search(r'Stop Targets:\s*(\d+\.?\d*)', text, re.IGNORECASE)
-        return float(match.group(1)) if match else None
\ No newline at end of file
+        return [float(tp) for tp in matches]
\ No newline at end of file
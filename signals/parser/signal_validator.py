@@ -4,12 +4,13 @@
 class SignalValidator:
     """Валидация сообщений на предмет торговых сигналов"""
 
-    REQUIRED_KEYWORDS = [
+    REQUIRED_KEYWORDS = (
         "Leverage:",
         "Entry Targets:",
         "Take-Profit Targets:",
         "Stop Targets:"
-    ]
+    )
+    _REQUIRED_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in REQUIRED_KEYWORDS)
 
     @staticmethod
     def is_signal(text: str) -> bool:
@@ -22,13 +23,13 @@ class SignalValidator:
         Returns:
             True если это сигнал, False иначе
         """
-        if not text:
+        # Все ключевые слова заканчиваются на ':' - дешевый отсев обычных сообщений
+        if not text or ':' not in text:
             return False
 
-        text_lower = text.lower()
-
-        for keyword in SignalValidator.REQUIRED_KEYWORDS:
-            if keyword.lower() not in text_lower:
-                return False
+        # Обычно ключевые слова приходят в исходном регистре - проверка без копирования текста
+        if all(keyword in text for keyword in SignalValidator.REQUIRED_KEYWORDS):
+            return True
 
-        return True
\ No newline at end of file
+        text_lower = text.lower()
+        return all(keyword in text_lower for keyword in SignalValidator._REQUIRED_KEYWORDS_LOWER)
\ No newline at end of file
@@ -0,0 +1,72 @@
+# signals/signal_queue.py
+import asyncio
+from collections import deque
+from typing import Deque
+from signals.models import Signal
+
+
+class SignalQueue:
+    """
+    Очередь сигналов для одного потребителя
+
+    Облегченная замена asyncio.Queue на deque + asyncio.Event:
+    без futures ожидающих на каждый get/put. Производителей может быть
+    несколько: Telethon обрабатывает каждое обновление в отдельной задаче,
+    поэтому в put() одновременно могут ждать несколько обработчиков.
+    Все они работают в одном event loop, поэтому проверка места и
+    добавление в put() не прерываются другим производителем
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items: Deque[Signal] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def qsize(self) -> int:
+        """Количество сигналов в очереди"""
+        return len(self._items)
+
+    def full(self) -> bool:
+        """Проверка заполненности очереди"""
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, signal: Signal) -> None:
+        """
+        Добавление сигнала без ожидания
+
+        Raises:
+            asyncio.QueueFull: Если очередь заполнена
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(signal)
+        self._not_empty.set()
+
+    async def put(self, signal: Signal) -> None:
+        """Добавление сигнала с ожиданием свободного места"""
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(signal)
+
+    def get_nowait(self) -> Signal:
+        """
+        Извлечение сигнала без ожидания
+
+        Raises:
+            asyncio.QueueEmpty: Если очередь пуста
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+        signal = self._items.popleft()
+        self._not_full.set()
+        return signal
+
+    async def get(self) -> Signal:
+        """Извлечение сигнала с ожиданием его появления"""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
\ No newline at end of file
@@ -1,16 +1,29 @@
 # trading/bybit_client.py
 import asyncio
-from typing import Dict, List
+import time
+from decimal import Decimal
+from typing import Dict, List, Tuple
 from pybit.unified_trading import HTTP
 from trading.config import TradingConfig
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+# Максимум ордеров в одном запросе /v5/order/create-batch
+BATCH_ORDER_LIMIT = 10
+# minOrderQty меняется только на регламентных работах биржи
+MIN_QTY_CACHE_TTL = 24 * 60 * 60
+# Ответы Bybit "значение уже установлено", которые не считаются ошибкой
+_LEVERAGE_NOT_MODIFIED_TOKENS = ("110043", "leverage not modified")
+_POSITION_MODE_NOT_MODIFIED_TOKENS = ("110025", "Position mode is not modified")
+
 
 class BybitClient:
     """Асинхронная обертка над Bybit API"""
 
+    __slots__ = ('config', 'http', 'hedge_mode_enabled', '_min_qty_cache')
+
     def __init__(self, config: TradingConfig):
-        self.logger = get_logger(__name__)
         self.config = config
         self.http = HTTP(
             api_key=config.api_key,
@@ -20,66 +33,71 @@ class BybitClient:
             recv_window=5_000
         )
         self.hedge_mode_enabled = False
+        self._min_qty_cache: Dict[str, Tuple[Decimal, float]] = {}
 
     async def enable_hedge_mode(self) -> None:
         """Включение hedge mode для USDT perpetual"""
         if self.hedge_mode_enabled:
-            self.logger.info("Hedge mode уже включен")
+            logger.info("Hedge mode уже включен")
             return
 
-        self.logger.info("Включение hedge mode...")
+        logger.info("Включение hedge mode...")
 
-        def _enable():
-            return self.http.switch_position_mode(
+        try:
+            resp = await asyncio.to_thread(
+                self.http.switch_position_mode,
                 category="linear",
                 coin="USDT",
                 mode=3
             )
 
-        resp = await asyncio.to_thread(_enable)
+            if not isinstance(resp, dict) or resp.get("retCode") != 0:
+                raise RuntimeError(f"Ошибка включения hedge mode: {resp}")
 
-        if not isinstance(resp, dict) or resp.get("retCode") != 0:
-            raise RuntimeError(f"Ошибка включения hedge mode: {resp}")
+            logger.info("Hedge mode успешно включен")
+        except Exception as e:
+            error_msg = str(e)
+            if not any(token in error_msg for token in _POSITION_MODE_NOT_MODIFIED_TOKENS):
+                raise
+            logger.info("Hedge mode уже включен")
 
         self.hedge_mode_enabled = True
-        self.logger.info("Hedge mode успешно включен")
 
     async def set_leverage(self, symbol: str, leverage: int) -> None:
         """Установка кредитного плеча"""
-        self.logger.info(f"Установка плеча {leverage}x для {symbol}")
+        logger.info("Установка плеча %sx для %s", leverage, symbol)
 
-        def _set():
-            return self.http.set_leverage(
+        try:
+            resp = await asyncio.to_thread(
+                self.http.set_leverage,
                 category="linear",
                 symbol=symbol,
                 buyLeverage=str(leverage),
                 sellLeverage=str(leverage)
             )
 
-        try:
-            resp = await asyncio.to_thread(_set)
-
             if not isinstance(resp, dict) or resp.get("retCode") != 0:
                 raise RuntimeError(f"Ошибка установки плеча: {resp}")
 
-            self.logger.info(f"Плечо {leverage}x установлено для {symbol}")
+            logger.info("Плечо %sx установлено для %s", leverage, symbol)
         except Exception as e:
             error_msg = str(e)
-            if "110043" in error_msg or "leverage not modified" in error_msg:
-                self.logger.info(f"Плечо {leverage}x уже установлено для {symbol}")
+            if any(token in error_msg for token in _LEVERAGE_NOT_MODIFIED_TOKENS):
+                logger.info("Плечо %sx уже установлено для %s", leverage, symbol)
             else:
                 raise
 
-    async def get_min_order_qty(self, symbol: str) -> str:
-        """Получение минимального размера ордера"""
+    async def get_min_order_qty(self, symbol: str) -> Decimal:
+        """Получение минимального размера ордера (кешируется на MIN_QTY_CACHE_TTL)"""
+        cached = self._min_qty_cache.get(symbol)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
 
-        def _get():
-            return self.http.get_instruments_info(
-                category="linear",
-                symbol=symbol
-            )
-
-        resp = await asyncio.to_thread(_get)
+        resp = await asyncio.to_thread(
+            self.http.get_instruments_info,
+            category="linear",
+            symbol=symbol
+        )
 
         if not isinstance(resp, dict) or resp.get("retCode") != 0:
             raise RuntimeError(f"Ошибка получения информации о символе: {resp}")
@@ -94,7 +112,10 @@ class BybitClient:
         if min_qty is None:
             raise RuntimeError(f"minOrderQty не найден для {symbol}")
 
-        return str(min_qty)
+        min_qty = Decimal(str(min_qty))
+        self._min_qty_cache[symbol] = (min_qty, time.monotonic() + MIN_QTY_CACHE_TTL)
+
+        return min_qty
 
     async def place_market_order(
             self,
@@ -117,29 +138,27 @@ class BybitClient:
         Returns:
             Order ID
         """
-        self.logger.info(f"Открытие {side} позиции по {symbol}: qty={qty}, SL={sl_price}")
-
-        def _place():
-            return self.http.place_order(
-                category="linear",
-                symbol=symbol,
-                side=side,
-                orderType="Market",
-                qty=str(qty),
-                stopLoss=str(sl_price),
-                slTriggerBy="MarkPrice",
-                tpslMode="Full",
-                slOrderType="Market",
-                positionIdx=str(position_idx)
-            )
-
-        resp = await asyncio.to_thread(_place)
+        logger.info("Открытие %s позиции по %s: qty=%s, SL=%s", side, symbol, qty, sl_price)
+
+        resp = await asyncio.to_thread(
+            self.http.place_order,
+            category="linear",
+            symbol=symbol,
+            side=side,
+            orderType="Market",
+            qty=str(qty),
+            stopLoss=str(sl_price),
+            slTriggerBy="MarkPrice",
+            tpslMode="Full",
+            slOrderType="Market",
+            positionIdx=str(position_idx)
+        )
 
         if not isinstance(resp, dict) or resp.get("retCode") != 0:
             raise RuntimeError(f"Ошибка открытия позиции: {resp}")
 
         order_id = resp.get("result", {}).get("orderId", "<unknown>")
-        self.logger.info(f"Позиция открыта: orderId={order_id}")
+        logger.info("Позиция открыта: orderId=%s", order_id)
 
         return order_id
 
@@ -162,35 +181,91 @@ class BybitClient:
         Returns:
             Список order IDs
         """
-        self.logger.info(f"Выставление {len(orders)} TP ордеров для {symbol}")
+        logger.info("Выставление %d TP ордеров для %s", len(orders), symbol)
+
+        starts = range(0, len(orders), BATCH_ORDER_LIMIT)
+        results = await asyncio.gather(
+            *(
+                self._place_reduce_batch(symbol, side, orders, start, position_idx)
+                for start in starts
+            ),
+            return_exceptions=True
+        )
+
+        order_ids = []
+        for start, result in zip(starts, results):
+            if isinstance(result, BaseException):
+                logger.error("Ошибка пакета TP ордеров [%d-%d]: %s",
+                             start + 1, min(start + BATCH_ORDER_LIMIT, len(orders)), result)
+                continue
+            order_ids.extend(result)
+
+        return order_ids
+
+    async def _place_reduce_batch(
+            self,
+            symbol: str,
+            side: str,
+            orders: List[Dict[str, float]],
+            start: int,
+            position_idx: int
+    ) -> List[str]:
+        """
+        Выставление одного пакета TP ордеров (не более BATCH_ORDER_LIMIT)
+
+        Args:
+            symbol: Торговая пара
+            side: Sell для Long, Buy для Short
+            orders: Полный список TP ордеров
+            start: Индекс первого ордера пакета
+            position_idx: 1 для Long, 2 для Short
+
+        Returns:
+            Список order IDs выставленных ордеров пакета
+        """
+        batch = orders[start:start + BATCH_ORDER_LIMIT]
+        request = [
+            {
+                "symbol": symbol,
+                "side": side,
+                "orderType": "Limit",
+                "price": str(order["price"]),
+                "qty": str(order["qty"]),
+                "timeInForce": "GTC",
+                "reduceOnly": True,
+                "positionIdx": position_idx
+            }
+            for order in batch
+        ]
+
+        resp = await asyncio.to_thread(
+            self.http.place_batch_order,
+            category="linear",
+            request=request
+        )
+
+        if not isinstance(resp, dict) or resp.get("retCode") != 0:
+            raise RuntimeError(f"Ошибка пакета TP ордеров: {resp}")
+
+        results = resp.get("result", {}).get("list", [])
+        statuses = resp.get("retExtInfo", {}).get("list", [])
 
         order_ids = []
 
-        for i, order in enumerate(orders, start=1):
-            price = order["price"]
-            qty = order["qty"]
-
-            def _place():
-                return self.http.place_order(
-                    category="linear",
-                    symbol=symbol,
-                    side=side,
-                    orderType="Limit",
-                    price=str(price),
-                    qty=str(qty),
-                    timeInForce="GTC",
-                    reduceOnly=True,
-                    positionIdx=str(position_idx)
-                )
-
-            resp = await asyncio.to_thread(_place)
+        for offset, order in enumerate(batch):
+            i = start + offset + 1
+            status = statuses[offset] if offset < len(statuses) else {}
 
-            if not isinstance(resp, dict) or resp.get("retCode") != 0:
-                self.logger.error(f"Ошибка TP ордера [{i}]: {resp}")
+            if status.get("code", 0) != 0:
+                logger.error("Ошибка TP ордера [%d]: %s", i, status)
                 continue
 
-            order_id = resp.get("result", {}).get("orderId", "<unknown>")
+            result = results[offset] if offset < len(results) else {}
+            order_id = result.get("orderId", "<unknown>")
             order_ids.append(order_id)
-            self.logger.info(f"TP [{i}/{len(orders)}] выставлен: price={price}, qty={qty}, orderId={order_id}")
+            logger.info(
+                "TP [%d/%d] выставлен: price=%s, qty=%s, orderId=%s",
+                i, len(orders), order["price"], order["qty"], order_id
+            )
 
         return order_ids
\ No newline at end of file
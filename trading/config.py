@@ -1,7 +1,6 @@
 # trading/config.py
 import os
 from dataclasses import dataclass
-from dotenv import load_dotenv
 
 
 @dataclass
@@ -24,8 +23,6 @@ class TradingConfig:
         Raises:
             ValueError: Если обязательные параметры отсутствуют или некорректны
         """
-        load_dotenv()
-
         balance_str = os.getenv('BALANCE')
         amount_str = os.getenv('AMOUNT')
         api_key = os.getenv('BYBIT_API_KEY')
@@ -1,25 +1,37 @@
 # trading/position_manager.py
+import asyncio
+import logging
 from typing import List, Dict
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal
 from signals.models import Signal
 from trading.bybit_client import BybitClient
 from trading.config import TradingConfig
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+# Направление сигнала -> (сторона входа, positionIdx в hedge mode, сторона TP)
+_SIDE_MAP = {
+    'Long': ('Buy', 1, 'Sell'),
+    'Short': ('Sell', 2, 'Buy'),
+}
+
 
 class PositionManager:
     """Управление торговыми позициями"""
 
+    __slots__ = ('bybit_client', 'config', 'margin')
+
     def __init__(self, bybit_client: BybitClient, config: TradingConfig):
-        self.logger = get_logger(__name__)
         self.bybit_client = bybit_client
         self.config = config
+        self.margin = config.balance * (config.amount / 100)
 
     def calculate_position_size(
             self,
             entry_price: float,
             leverage: int,
-            min_qty_str: str
+            min_qty: Decimal
     ) -> float:
         """
         Расчет размера позиции
@@ -27,25 +39,20 @@ class PositionManager:
         Args:
             entry_price: Цена входа
             leverage: Кредитное плечо
-            min_qty_str: Минимальный размер ордера (например "0.1")
+            min_qty: Минимальный размер ордера (например Decimal("0.1"))
 
         Returns:
             Размер позиции в монетах
         """
-        margin = self.config.balance * (self.config.amount / 100)
-        volume = margin * leverage
+        volume = self.margin * leverage
         qty = volume / entry_price
 
-        min_qty = Decimal(min_qty_str)
+        # Округление вниз до шага min_qty в Decimal: во float 0.3 // 0.1 == 2.0
+        result = float(Decimal(str(qty)) // min_qty * min_qty)
 
-        qty_decimal = Decimal(str(qty))
-        rounded_qty = qty_decimal.quantize(min_qty, rounding=ROUND_DOWN)
-
-        result = float(rounded_qty)
-
-        self.logger.info(
-            f"Расчет позиции: margin={margin:.2f} USDT, volume={volume:.2f} USDT, "
-            f"qty={qty:.4f} -> rounded={result}"
+        logger.info(
+            "Расчет позиции: margin=%.2f USDT, volume=%.2f USDT, qty=%.4f -> rounded=%s",
+            self.margin, volume, qty, result
         )
 
         return result
@@ -54,7 +61,7 @@ class PositionManager:
             self,
             total_qty: float,
             tp_prices: List[float],
-            min_qty_str: str
+            min_qty: Decimal
     ) -> List[Dict[str, float]]:
         """
         Распределение объема по TP ордерам
@@ -62,34 +69,29 @@ class PositionManager:
         Args:
             total_qty: Общий объем позиции
             tp_prices: Список цен TP
-            min_qty_str: Минимальный размер ордера
+            min_qty: Минимальный размер ордера
 
         Returns:
             Список [{"price": ..., "qty": ...}, ...]
         """
         num_tps = len(tp_prices)
-        min_qty = Decimal(min_qty_str)
-
-        qty_per_tp = Decimal(str(total_qty)) / Decimal(str(num_tps))
-        rounded_qty_per_tp = qty_per_tp.quantize(min_qty, rounding=ROUND_DOWN)
 
-        orders = []
-        total_allocated = Decimal('0')
+        # Деление в целых шагах min_qty: без Decimal-арифметики на каждый TP
+        total_steps = int(Decimal(str(total_qty)) // min_qty)
+        steps_per_tp = total_steps // num_tps
+        first_steps = total_steps - steps_per_tp * (num_tps - 1)
 
-        for i, price in enumerate(tp_prices):
-            if i == 0:
-                first_qty = Decimal(str(total_qty)) - (rounded_qty_per_tp * Decimal(str(num_tps - 1)))
-                qty = float(first_qty)
-            else:
-                qty = float(rounded_qty_per_tp)
+        qty_per_tp = float(steps_per_tp * min_qty)
+        first_qty = float(first_steps * min_qty)
 
-            orders.append({"price": price, "qty": qty})
-            total_allocated += Decimal(str(qty))
+        orders = [{"price": tp_prices[0], "qty": first_qty}]
+        orders.extend({"price": price, "qty": qty_per_tp} for price in tp_prices[1:])
 
-        self.logger.info(
-            f"Распределение TP: total={total_qty}, per_tp={float(rounded_qty_per_tp)}, "
-            f"first_tp={orders[0]['qty']}, allocated={float(total_allocated)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Распределение TP: total=%s, per_tp=%s, first_tp=%s, allocated=%s",
+                total_qty, qty_per_tp, first_qty, float(total_steps * min_qty)
+            )
 
         return orders
 
@@ -101,30 +103,23 @@ class PositionManager:
             signal: Торговый сигнал
         """
         try:
-            self.logger.info(f"Обработка сигнала: {signal}")
-
-            await self.bybit_client.enable_hedge_mode()
+            logger.info("Обработка сигнала: %s", signal)
 
             symbol = signal.asset.replace('/', '')
 
-            await self.bybit_client.set_leverage(symbol, signal.leverage)
-
-            min_qty_str = await self.bybit_client.get_min_order_qty(symbol)
+            _, _, min_qty = await asyncio.gather(
+                self.bybit_client.enable_hedge_mode(),
+                self.bybit_client.set_leverage(symbol, signal.leverage),
+                self.bybit_client.get_min_order_qty(symbol)
+            )
 
             position_size = self.calculate_position_size(
                 signal.entry,
                 signal.leverage,
-                min_qty_str
+                min_qty
             )
 
-            if signal.direction == 'Long':
-                side = 'Buy'
-                position_idx = 1
-                tp_side = 'Sell'
-            else:
-                side = 'Sell'
-                position_idx = 2
-                tp_side = 'Buy'
+            side, position_idx, tp_side = _SIDE_MAP[signal.direction]
 
             await self.bybit_client.place_market_order(
                 symbol=symbol,
@@ -137,7 +132,7 @@ class PositionManager:
             tp_orders = self.split_tp_orders(
                 position_size,
                 signal.take_profits,
-                min_qty_str
+                min_qty
             )
 
             tp_order_ids = await self.bybit_client.place_reduce_limit_orders(
@@ -147,8 +142,8 @@ class PositionManager:
                 position_idx=position_idx
             )
 
-            self.logger.info(f"Выставлено {len(tp_order_ids)} TP ордеров")
-            self.logger.info(f"Сигнал успешно обработан: {signal.asset} {signal.direction}")
+            logger.info("Выставлено %d TP ордеров", len(tp_order_ids))
+            logger.info("Сигнал успешно обработан: %s %s", signal.asset, signal.direction)
 
         except Exception as e:
-            self.logger.error(f"Ошибка обработки сигнала: {e}", exc_info=True)
\ No newline at end of file
+            logger.error("Ошибка обработки сигнала: %s", e, exc_info=True)
\ No newline at end of file
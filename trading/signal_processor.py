@@ -1,32 +1,107 @@
 # trading/signal_processor.py
 import asyncio
+from typing import Dict, Set
+from signals.models import Signal
+from signals.signal_queue import SignalQueue
 from trading.position_manager import PositionManager
 from utils.logger import get_logger
 
+logger = get_logger(__name__)
 
-async def process_signals_queue(signal_queue: asyncio.Queue, position_manager: PositionManager) -> None:
+MAX_CONCURRENT_SIGNALS = 4
+# Сколько сигналов может быть извлечено из очереди одновременно, включая
+# ожидающих завершения предыдущего сигнала по своему символу
+MAX_DEQUEUED_SIGNALS = 32
+
+
+async def _process_signal(
+        signal: Signal,
+        position_manager: PositionManager,
+        symbol_lock: asyncio.Lock,
+        run_slots: asyncio.Semaphore,
+        running: Set[asyncio.Task]
+) -> None:
+    """
+    Открытие позиции по сигналу
+
+    Сигналы по одному символу выполняются по очереди: иначе set_leverage
+    одного сигнала может изменить плечо рыночного ордера другого.
+    Слот выполнения берется только после блокировки символа, поэтому
+    ожидающий своего символа сигнал не задерживает сигналы других символов
+
+    Args:
+        signal: Сигнал из очереди
+        position_manager: Менеджер позиций
+        symbol_lock: Блокировка символа сигнала
+        run_slots: Ограничитель одновременно выполняемых сигналов
+        running: Задачи, уже начавшие работу с биржей
+    """
+    async with symbol_lock, run_slots:
+        task = asyncio.current_task()
+        running.add(task)
+        try:
+            await position_manager.open_position_with_signal(signal)
+        except Exception as e:
+            logger.error("Ошибка обработки сигнала из очереди: %s", e, exc_info=True)
+        finally:
+            running.discard(task)
+
+
+async def process_signals_queue(signal_queue: SignalQueue, position_manager: PositionManager) -> None:
     """
     Обработка очереди сигналов
 
+    Независимые сигналы обрабатываются параллельно, не более
+    MAX_CONCURRENT_SIGNALS одновременно. Из очереди извлекается не более
+    MAX_DEQUEUED_SIGNALS необработанных сигналов, остальные ждут в очереди
+    и ее ограничение продолжает действовать
+
     Args:
         signal_queue: Очередь с сигналами
         position_manager: Менеджер позиций
     """
-    logger = get_logger(__name__)
     logger.info("Процессор сигналов запущен")
 
+    run_slots = asyncio.Semaphore(MAX_CONCURRENT_SIGNALS)
+    dequeue_slots = asyncio.Semaphore(MAX_DEQUEUED_SIGNALS)
+    symbol_locks: Dict[str, asyncio.Lock] = {}
+    in_flight: Set[asyncio.Task] = set()
+    running: Set[asyncio.Task] = set()
+
+    def _on_done(task: asyncio.Task) -> None:
+        # Слот освобождается и при отмене задачи, которая не успела запуститься
+        in_flight.discard(task)
+        dequeue_slots.release()
+
     while True:
         try:
-            signal = await signal_queue.get()
+            await dequeue_slots.acquire()
+            try:
+                signal = await signal_queue.get()
+            except BaseException:
+                dequeue_slots.release()
+                raise
 
-            logger.info(f"Получен сигнал из очереди: {signal}")
-
-            await position_manager.open_position_with_signal(signal)
+            logger.info("Получен сигнал из очереди: %s", signal)
 
-            signal_queue.task_done()
+            symbol_lock = symbol_locks.setdefault(signal.asset, asyncio.Lock())
+            task = asyncio.create_task(
+                _process_signal(signal, position_manager, symbol_lock, run_slots, running)
+            )
+            in_flight.add(task)
+            task.add_done_callback(_on_done)
 
         except asyncio.CancelledError:
+            not_started = [task for task in in_flight if task not in running]
+            if not_started:
+                logger.warning("Отмена %d сигналов, обработка которых не началась", len(not_started))
+                for task in not_started:
+                    task.cancel()
+            if running:
+                logger.info("Ожидание завершения %d сигналов в обработке", len(running))
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
             logger.info("Процессор сигналов остановлен")
             break
         except Exception as e:
-            logger.error(f"Ошибка обработки сигнала из очереди: {e}", exc_info=True)
\ No newline at end of file
+            logger.error("Ошибка обработки сигнала из очереди: %s", e, exc_info=True)
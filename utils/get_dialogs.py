@@ -1,21 +1,27 @@
 # utils/get_dialogs.py
 import asyncio
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from telethon import TelegramClient
 from telethon.tl.types import Channel, Chat, User
 
+_DIALOG_LINE = "Тип: {:12} | ID: {:15} | Username: {:25} | Название: {}".format
+
+
+# Точный тип сущности Telethon -> функция определения типа чата
+_CHAT_TYPES = {
+    User: lambda entity: "bot" if entity.bot else "private",
+    Channel: lambda entity: "channel" if entity.broadcast else "supergroup",
+    Chat: lambda entity: "group",
+}
+
 
 def get_chat_type(entity) -> str:
     """Определение типа чата"""
-    if isinstance(entity, User):
-        return "private" if not entity.bot else "bot"
-    elif isinstance(entity, Channel):
-        return "channel" if entity.broadcast else "supergroup"
-    elif isinstance(entity, Chat):
-        return "group"
-    return "unknown"
+    resolve = _CHAT_TYPES.get(type(entity))
+    return resolve(entity) if resolve else "unknown"
 
 
 async def main():
@@ -53,7 +59,8 @@ async def main():
         client = TelegramClient(
             str(session_path),
             int(api_id),
-            api_hash
+            api_hash,
+            receive_updates=False
         )
 
         await client.connect()
@@ -71,21 +78,25 @@ async def main():
         print("СПИСОК ВАШИХ ДИАЛОГОВ (КАНАЛЫ, ГРУППЫ, ЧАТЫ)")
         print("=" * 80 + "\n")
 
-        dialog_count = 0
+        lines = []
 
         async for dialog in client.iter_dialogs():
             entity = dialog.entity
-            chat_type = get_chat_type(entity)
-            chat_title = dialog.name
-            chat_id = dialog.id
+            username = getattr(entity, 'username', None)
 
-            username = f"@{entity.username}" if hasattr(entity, 'username') and entity.username else "Нет username"
+            lines.append(_DIALOG_LINE(
+                get_chat_type(entity),
+                dialog.id,
+                f"@{username}" if username else "Нет username",
+                dialog.name
+            ))
 
-            print(f"Тип: {chat_type:12} | ID: {chat_id:15} | Username: {username:25} | Название: {chat_title}")
-            dialog_count += 1
+        # Вывод одной записью вместо print() на каждый диалог
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print("\n" + "=" * 80)
-        print(f"Всего диалогов: {dialog_count}")
+        print(f"Всего диалогов: {len(lines)}")
         print("=" * 80)
         print("\nСкопируйте chat ID нужного канала и вставьте в .env как CHANNEL_NAME\n")
 
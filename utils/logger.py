@@ -1,26 +1,202 @@
 # utils/logger.py
+import atexit
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, List
+
+FILE_BUFFER_CAPACITY = 100
+FILE_FLUSH_INTERVAL = 30
+
+LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)-37s | %(message)s'
+LOG_DATE_FORMAT = '%d-%m-%y %H:%M:%S'
+
+# Логгеры и обработчики, созданные get_logger, для set_log_level
+_LOGGERS: Dict[str, logging.Logger] = {}
+_HANDLERS: List[logging.Handler] = []
+
+# Формат логов не использует поток, процесс и задачу asyncio -
+# не собираем эти атрибуты для каждой записи
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
 
 
 class MillisecondFormatter(logging.Formatter):
     """Форматтер с миллисекундами (3 цифры)"""
 
-    def formatTime(self, record, datefmt=None):
-        if datefmt:
-            s = datetime.fromtimestamp(record.created).strftime(datefmt)
-            s = f"{s}.{int(record.msecs):03d}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ((секунда, формат), отформатированная дата): strftime только при смене
+        # секунды. Кортеж присваивается целиком, поэтому безопасен между потоками
+        self._time_cache = (None, "")
+        # Для формата проекта сборка строки без PercentStyle
+        self._is_project_format = self._style._fmt == LOG_FORMAT
+
+    def format(self, record):
+        # Консольный и файловый обработчики делят один форматтер:
+        # запись форматируется один раз, второй обработчик берет готовую строку
+        cached = record.__dict__.get('_formatted')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        if (not self._is_project_format
+                or record.exc_info or record.exc_text or record.stack_info):
+            s = super().format(record)
         else:
-            s = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-            s = f"{s}.{int(record.msecs):03d}"
+            record.message = record.getMessage()
+            s = (
+                f"{self.formatTime(record, self.datefmt)} | {record.levelname:<8} | "
+                f"{record.name:<37} | {record.message}"
+            )
+
+        record._formatted = (self, s)
         return s
 
+    def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        cached_key, s = self._time_cache
+        if key != cached_key:
+            s = time.strftime(datefmt or "%Y-%m-%d %H:%M:%S", time.localtime(key[0]))
+            self._time_cache = (key, s)
+        return f"{s}.{int(record.msecs):03d}"
+
+
+_FORMATTER = MillisecondFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+
+class AppendFileHandler(logging.Handler):
+    """
+    Буферизованная запись логов в файл напрямую через os.write
+
+    Файл открывается один раз с O_APPEND, без слоев TextIOWrapper и
+    BufferedWriter. Закодированные записи копятся в bytearray и пишутся
+    одним системным вызовом: при заполнении буфера, на уровне
+    flush_level и выше, а также при flush() и close()
+    """
+
+    def __init__(self, path: Path, capacity: int, flush_level: int = logging.ERROR):
+        super().__init__()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._buffer = bytearray()
+        self._pending = 0
+        self.capacity = capacity
+        self.flush_level = flush_level
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer += (self.format(record) + "\n").encode("utf-8")
+            self._pending += 1
+            if self._pending >= self.capacity or record.levelno >= self.flush_level:
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def _write_buffer(self) -> None:
+        """Запись накопленного буфера в файл (вызывается под self.lock)"""
+        while self._buffer and self._fd is not None:
+            written = os.write(self._fd, self._buffer)
+            del self._buffer[:written]
+        self._pending = 0
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write_buffer()
+
+    def close(self) -> None:
+        with self.lock:
+            try:
+                self._write_buffer()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                super().close()
+
+
+def _flush_periodically(handler: logging.Handler, interval: float) -> None:
+    """Периодический сброс буфера, чтобы записи не задерживались в памяти надолго"""
+    while True:
+        time.sleep(interval)
+        handler.flush()
+
+
+@lru_cache(maxsize=1)
+def _get_file_handler() -> logging.Handler:
+    """
+    Создает общий для всех логгеров буферизованный файловый обработчик
+
+    Помимо сброса по заполнению буфера и уровню ERROR, буфер пишется
+    раз в FILE_FLUSH_INTERVAL секунд и при завершении процесса
+    (logging.shutdown закрывает обработчик)
+
+    Returns:
+        Буферизованный файловый обработчик
+    """
+    project_root = Path(__file__).resolve().parent.parent
+    logs_dir = project_root / "logs"
+    logs_dir.mkdir(exist_ok=True)
+
+    log_file_path = logs_dir / "logs.txt"
+
+    file_handler = AppendFileHandler(log_file_path, capacity=FILE_BUFFER_CAPACITY)
+    file_handler.setFormatter(_FORMATTER)
+
+    threading.Thread(
+        target=_flush_periodically,
+        args=(file_handler, FILE_FLUSH_INTERVAL),
+        name="log-flush",
+        daemon=True
+    ).start()
+
+    return file_handler
 
+
+@lru_cache(maxsize=1)
+def _get_queue_handler() -> QueueHandler:
+    """
+    Создает общий обработчик-очередь и запускает фоновый поток вывода
+
+    Логгеры только кладут записи в очередь, а консольный и файловый вывод
+    выполняет QueueListener в отдельном потоке. При завершении процесса
+    слушатель останавливается и дописывает оставшиеся записи
+
+    Returns:
+        Обработчик, помещающий записи в очередь
+    """
+    log_queue = queue.SimpleQueue()
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(_FORMATTER)
+
+    listener = QueueListener(
+        log_queue,
+        console_handler,
+        _get_file_handler(),
+        respect_handler_level=True
+    )
+    listener.start()
+    # atexit выполняет обработчики в обратном порядке: очередь будет
+    # разобрана до logging.shutdown, который сбросит файловый буфер
+    atexit.register(listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    _HANDLERS.extend((queue_handler, console_handler, _get_file_handler()))
+
+    return queue_handler
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
-    Создает логгер с консольным и файловым выводом
+    Создает логгер с консольным и файловым выводом через фоновый поток
 
     Args:
         name: Имя логгера
@@ -36,28 +212,9 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
 
     logger.setLevel(level)
 
-    formatter = MillisecondFormatter(
-        fmt='%(asctime)s | %(levelname)-8s | %(name)-37s | %(message)s',
-        datefmt='%d-%m-%y %H:%M:%S'
-    )
-
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-
-    project_root = Path(__file__).resolve().parent.parent
-    logs_dir = project_root / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    log_file_path = logs_dir / "logs.txt"
-
-    file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_get_queue_handler())
     logger.propagate = False
+    _LOGGERS[name] = logger
 
     return logger
 
@@ -66,6 +223,9 @@ def set_log_level(level: int) -> None:
     """
     Устанавливает уровень логирования для всех логгеров
 
+    Логгеры из get_logger не передают записи корневому (propagate=False),
+    поэтому уровень выставляется каждому из них и их обработчикам
+
     Args:
         level: Уровень логирования
     """
@@ -73,4 +233,10 @@ def set_log_level(level: int) -> None:
     root_logger.setLevel(level)
 
     for handler in root_logger.handlers:
+        handler.setLevel(level)
+
+    for logger in _LOGGERS.values():
+        logger.setLevel(level)
+
+    for handler in _HANDLERS:
         handler.setLevel(level)
\ No newline at end of file